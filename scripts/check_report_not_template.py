@@ -4,11 +4,20 @@ Fail if the summary report looks like an unfilled template.
 """
 
 import argparse
+import bisect
+import functools
+import hashlib
+import itertools
 import json
 import re
 from pathlib import Path
 from typing import Optional, Tuple
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 
 PLACEHOLDER_TOKENS = [
     "DNA 存储论文精读模板",
@@ -46,6 +55,10 @@ DISALLOWED_PHRASES = [
 
 LEGACY_JUDGMENT_TAGS = ["[明确]", "[推断]", "[缺失]"]
 
+LISTED_PHRASES = frozenset(PLACEHOLDER_TOKENS + DISALLOWED_PHRASES + LEGACY_JUDGMENT_TAGS)
+# Longest-first so that a match at a position is the longest listed phrase starting there.
+LISTED_PHRASE_RE = re.compile("|".join(re.escape(item) for item in sorted(LISTED_PHRASES, key=len, reverse=True)))
+
 BLANK_FIELD_RE = re.compile(r"^\s*-\s*[^:：]{1,40}[：:]\s*$")
 BLANK_NUMBERED_FIELD_RE = re.compile(r"^\s*\d+\.\s*[^:：]{1,60}[：:]\s*$")
 BLANK_CLAIM_RE = re.compile(r"^\s*>\s*论述\d*[：:]\s*$")
@@ -58,7 +71,6 @@ FIGURE_NUMBERED_FIELD_RE = re.compile(r"^\s*\d+\.\s*图/表编号\s*[：:]\s*")
 FOOTNOTE_REF_RE = re.compile(r"\[\^([0-9]+-[0-9]+)\]")
 FOOTNOTE_DOT_STYLE_RE = re.compile(r"\[\^[0-9]+\.[0-9]+\]")
 FOOTNOTE_DEF_LINE_RE = re.compile(r"^\s*\[\^([0-9]+-[0-9]+)\]:\s*(.*)$")
-MULTISPACE_RE = re.compile(r"\s+")
 INLINE_CODE_IMAGE_RE = re.compile(r"`!\[[^\]]*\]\([^)]+\)`")
 QUOTED_IMAGE_URL_RE = re.compile(r"!\[[^\]]*\]\(\s*[\"'“”‘’]")
 QUOTED_IMAGE_WRAPPER_RE = re.compile(r"[“”‘’']!\[[^\]]*\]\([^)]+\)[“”‘’']")
@@ -83,14 +95,26 @@ PUBLISHABILITY_BULLET_RE = re.compile(r"^\s*-\s*可发表性推演(?:\s*[(（][^
 PUB_TIER_BULLET_RE = re.compile(
     r"^\s*-\s*可发表性(?:推演)?\s*[-—]?\s*(?:[(（]\s*)?(顶级|中等|一般)\s*(?:期刊/会议|期刊|会议)?(?:\s*[)）])?\s*[：:]\s*(.*)$"
 )
+SCORE_HEAD_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*(?:/10)?\s*")
+SCORE_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?(?:\s*/\s*10)?")
+NON_WORD_RE = re.compile(r"[\s\W_]+")
+BULLET_START_RE = re.compile(r"^\s*-\s+")
+TIER_LABELS = ("顶级", "中等", "一般")
+TIER_LABEL_RE = re.compile("|".join(TIER_LABELS))
 PREPRINT_MARKERS = ("预印本", "arxiv", "biorxiv", "medrxiv", "preprint")
+PREPRINT_MARKER_RE = re.compile("|".join(map(re.escape, PREPRINT_MARKERS)), re.IGNORECASE)
+REPORT_CACHE_NAME = ".check_report_cache.json"
+# Once this many issues are found, skip the section 12/14 checks: the report fails regardless.
+FAIL_FAST_ISSUE_LIMIT = 20
 
 
 def load_metadata(artifact_dir: Path) -> dict:
     metadata_path = artifact_dir / "metadata.json"
-    if not metadata_path.exists():
-        raise SystemExit(f"[ERROR] metadata.json not found: {metadata_path}")
-    return json.loads(metadata_path.read_text(encoding="utf-8"))
+    try:
+        data = metadata_path.read_bytes()
+    except FileNotFoundError:
+        raise SystemExit(f"[ERROR] metadata.json not found: {metadata_path}") from None
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 def load_summary_path(metadata: dict, artifact_dir: Path) -> Path:
@@ -100,6 +124,15 @@ def load_summary_path(metadata: dict, artifact_dir: Path) -> Path:
     return (artifact_dir / f"{artifact_dir.name}阅读总结.md").resolve()
 
 
+def read_report_text(summary_path: Path) -> str:
+    # One bulk read + decode is cheaper than the incremental text-mode decoder;
+    # normalize newlines the same way read_text() does.
+    text = summary_path.read_bytes().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def normalize_summary_mode(raw: str) -> str:
     mode = str(raw).strip().lower()
     if mode in {"short", "略读", "lue-du", "skim"}:
@@ -108,56 +141,77 @@ def normalize_summary_mode(raw: str) -> str:
 
 
 def normalize_heading(line: str) -> str:
-    return MULTISPACE_RE.sub(" ", line.strip())
+    return " ".join(line.split())
 
 
 def extract_level2_headings(text: str) -> list:
     headings = []
     for line in text.splitlines():
+        # Cheap prefix test first: only a handful of lines are headings.
+        if not line.lstrip().startswith("##"):
+            continue
         if LEVEL2_HEADING_RE.match(line):
             headings.append(normalize_heading(line))
     return headings
 
 
-def load_template_headings(summary_mode: str) -> tuple:
+def template_path_for(summary_mode: str) -> Path:
     root = Path(__file__).resolve().parents[1]
     template_name = "dna-short-template.md" if summary_mode == "略读" else "dna-deep-template.md"
-    template_path = root / "assets" / template_name
-    if not template_path.exists():
-        raise SystemExit(f"[ERROR] template not found for heading check: {template_path}")
-    headings = extract_level2_headings(template_path.read_text(encoding="utf-8"))
+    return root / "assets" / template_name
+
+
+def load_template_headings(summary_mode: str) -> tuple:
+    template_path = template_path_for(summary_mode)
+    try:
+        template_text = template_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise SystemExit(f"[ERROR] template not found for heading check: {template_path}") from None
+    headings = extract_level2_headings(template_text)
     if not headings:
         raise SystemExit(f"[ERROR] no level-2 headings found in template: {template_path}")
     return template_path, headings
 
 
+@functools.lru_cache(maxsize=None)
 def footnote_sort_key(note_id: str) -> tuple:
     chapter, index = note_id.split("-", 1)
     return int(chapter), int(index)
 
 
 def extract_footnote_refs(text: str) -> set:
-    return {m.group(1) for m in FOOTNOTE_REF_RE.finditer(text)}
+    return set(FOOTNOTE_REF_RE.findall(text))
 
 
-def parse_footnote_blocks(text: str) -> dict:
+def parse_footnote_blocks(lines: list, scan: dict) -> dict:
     blocks = {}
-    current_id = None
-
-    for line in text.splitlines():
-        match = FOOTNOTE_DEF_LINE_RE.match(line)
-        if match:
-            current_id = match.group(1)
-            blocks[current_id] = [match.group(2).strip()]
-            continue
+    def_lines = scan["footnote_def_lines"]
+
+    # Definitions were already matched by scan_report_lines; only walk their indented continuations.
+    for pos, (idx, note_id, first) in enumerate(def_lines):
+        end_idx = def_lines[pos + 1][0] if pos + 1 < len(def_lines) else len(lines)
+        parts = [first.strip()]
+        for line_idx in range(idx + 1, end_idx):
+            line = lines[line_idx]
+            # Continuations are indented by a tab or four spaces; test one char before the 4-char prefix.
+            lead = line[:1]
+            if lead != "\t" and not (lead == " " and line.startswith("    ")):
+                break
+            parts.append(line.strip())
+        blocks[note_id] = parts
 
-        if current_id and (line.startswith("    ") or line.startswith("\t")):
-            blocks[current_id].append(line.strip())
-            continue
+    return {note_id: " ".join(parts).strip() for note_id, parts in blocks.items()}
 
-        current_id = None
 
-    return {note_id: " ".join(parts).strip() for note_id, parts in blocks.items()}
+# Returns every placeholder token / disallowed phrase / legacy tag present in text, in one scan.
+def find_listed_phrases(text: str) -> set:
+    hits = set()
+    pos = 0
+    # Resume right after each match start so overlapping phrases are not skipped.
+    while (match := LISTED_PHRASE_RE.search(text, pos)) is not None:
+        hits.add(match.group(0))
+        pos = match.start() + 1
+    return {item for item in LISTED_PHRASES if any(item in hit for hit in hits)}
 
 
 def format_list(items: list, limit: int = 8) -> str:
@@ -166,9 +220,62 @@ def format_list(items: list, limit: int = 8) -> str:
     return ", ".join(items[:limit]) + f", ... (+{len(items) - limit})"
 
 
-def check_section_heading_integrity(report_text: str, expected: list) -> list:
+# Classifies every report line in a single pass and collects the indices the checks need.
+def scan_report_lines(lines: list) -> dict:
+    level2_idx = []
+    level3_footnote_idx = []
+    footnote_section_idx = []
+    figure_section_idx = []
+    footnote_def_lines = []
+    blank_fields = 0
+
+    for idx, line in enumerate(lines):
+        # Dispatch on the first non-space character so each line runs at most the regexes that can match it;
+        # plain prose lines run none.
+        first = line.lstrip()[:1]
+        if first == "#":
+            if LEVEL2_HEADING_RE.match(line):
+                level2_idx.append(idx)
+                if LEVEL2_FOOTNOTE_SECTION_RE.match(line):
+                    footnote_section_idx.append(idx)
+                elif LEVEL2_FIGURE_SECTION_RE.match(line):
+                    figure_section_idx.append(idx)
+            elif LEVEL3_FOOTNOTE_HEADING_RE.match(line):
+                level3_footnote_idx.append(idx)
+        elif first == "[":
+            match = FOOTNOTE_DEF_LINE_RE.match(line)
+            if match:
+                footnote_def_lines.append((idx, match.group(1), match.group(2)))
+        elif first == "-":
+            if BLANK_FIELD_RE.match(line):
+                blank_fields += 1
+        elif first == ">":
+            if BLANK_CLAIM_RE.match(line):
+                blank_fields += 1
+        elif first.isdigit():
+            if BLANK_NUMBERED_FIELD_RE.match(line):
+                blank_fields += 1
+
+    return {
+        "level2_idx": level2_idx,
+        "level2_headings": [normalize_heading(lines[idx]) for idx in level2_idx],
+        "level3_footnote_idx": level3_footnote_idx,
+        "footnote_section_idx": footnote_section_idx,
+        "figure_section_idx": figure_section_idx,
+        "footnote_def_lines": footnote_def_lines,
+        "blank_fields": blank_fields,
+    }
+
+
+def next_level2_idx(scan: dict, start_idx: int, default: int) -> int:
+    level2_idx = scan["level2_idx"]
+    pos = bisect.bisect_right(level2_idx, start_idx)
+    return level2_idx[pos] if pos < len(level2_idx) else default
+
+
+def check_section_heading_integrity(scan: dict, expected: list) -> list:
     issues = []
-    actual = extract_level2_headings(report_text)
+    actual = scan["level2_headings"]
 
     unexpected = [item for item in actual if item not in expected]
 
@@ -185,15 +292,14 @@ def check_section_heading_integrity(report_text: str, expected: list) -> list:
 
     return issues
 
-def check_footnote_section_placement(report_text: str) -> list:
+def check_footnote_section_placement(scan: dict) -> list:
     issues = []
-    lines = report_text.splitlines()
-    level2_idx = [idx for idx, line in enumerate(lines) if LEVEL2_HEADING_RE.match(line)]
+    level2_idx = scan["level2_idx"]
 
-    if any(LEVEL3_FOOTNOTE_HEADING_RE.match(line) for line in lines):
+    if scan["level3_footnote_idx"]:
         issues.append("contains per-section footnote heading `### 证据脚注`; footnotes must be unified at document end")
 
-    footnote_sections = [idx for idx, line in enumerate(lines) if LEVEL2_FOOTNOTE_SECTION_RE.match(line)]
+    footnote_sections = scan["footnote_section_idx"]
     if not footnote_sections:
         issues.append("missing final footnote section heading like `## N 证据脚注` (must be the last level-2 section)")
         return issues
@@ -205,26 +311,25 @@ def check_footnote_section_placement(report_text: str) -> list:
     if level2_idx and level2_idx[-1] != footnote_idx:
         issues.append("footnote section must be the last level-2 section in the report")
 
-    defs_before = [m.group(1) for idx, line in enumerate(lines[: footnote_idx + 1]) if (m := FOOTNOTE_DEF_LINE_RE.match(line))]
+    defs_before = [note_id for idx, note_id, _ in scan["footnote_def_lines"] if idx <= footnote_idx]
     if defs_before:
         issues.append(f"footnote definitions must appear after the final footnote section; found before: {format_list(sorted(set(defs_before), key=footnote_sort_key))}")
 
-    defs_after = [m.group(1) for line in lines[footnote_idx + 1 :] if (m := FOOTNOTE_DEF_LINE_RE.match(line))]
+    defs_after = [note_id for idx, note_id, _ in scan["footnote_def_lines"] if idx > footnote_idx]
     if not defs_after:
         issues.append("final footnote section exists but contains no footnote definitions")
 
     return issues
 
 
-def check_figure_section_format(report_text: str) -> list:
+def check_figure_section_format(lines: list, scan: dict) -> list:
     issues = []
-    lines = report_text.splitlines()
 
-    start_idx = next((idx for idx, line in enumerate(lines) if LEVEL2_FIGURE_SECTION_RE.match(line)), None)
-    if start_idx is None:
+    if not scan["figure_section_idx"]:
         return issues
 
-    end_idx = next((idx for idx in range(start_idx + 1, len(lines)) if LEVEL2_HEADING_RE.match(lines[idx])), len(lines))
+    start_idx = scan["figure_section_idx"][0]
+    end_idx = next_level2_idx(scan, start_idx, len(lines))
     block = lines[start_idx:end_idx]
 
     if any(FIGURE_LIST_HEADING_RE.match(line) for line in block):
@@ -240,14 +345,12 @@ def check_figure_section_format(report_text: str) -> list:
     return issues
 
 
-def check_footnote_integrity(report_text: str) -> list:
+def check_footnote_integrity(report_text: str, refs: set, footnote_blocks: dict) -> list:
     issues = []
 
     if FOOTNOTE_DOT_STYLE_RE.search(report_text):
         issues.append("contains dot-style footnote id; use [^章节-序号] such as [^1-1]")
 
-    refs = extract_footnote_refs(report_text)
-    footnote_blocks = parse_footnote_blocks(report_text)
     defs = set(footnote_blocks.keys())
 
     if not refs:
@@ -284,29 +387,26 @@ def check_markdown_media_syntax(report_text: str) -> list:
     return issues
 
 
-def check_missing_wording(report_text: str) -> list:
-    lines = report_text.splitlines()
-    footnote_sections = [idx for idx, line in enumerate(lines) if LEVEL2_FOOTNOTE_SECTION_RE.match(line)]
-    body = "\n".join(lines[: footnote_sections[0]]) if footnote_sections else report_text
-    if BODY_MISSING_WORDING_RE.search(body):
+def check_missing_wording(lines: list, scan: dict) -> list:
+    footnote_sections = scan["footnote_section_idx"]
+    body_end = footnote_sections[0] if footnote_sections else len(lines)
+    # The wording pattern never spans lines, so search line by line instead of re-joining the body.
+    if any(BODY_MISSING_WORDING_RE.search(line) for line in itertools.islice(lines, body_end)):
         return ["uses legacy missing wording (e.g. 不适用/原文未描述/原文未给); use `本文不涉及` instead"]
     return []
 
 
-def find_level2_section(lines: list[str], heading_re: re.Pattern) -> Optional[Tuple[int, int]]:
-    start_idx = next((idx for idx, line in enumerate(lines) if heading_re.match(line)), None)
-    if start_idx is None:
-        return None
-    end_idx = next(
-        (idx for idx in range(start_idx + 1, len(lines)) if LEVEL2_HEADING_RE.match(lines[idx])),
-        len(lines),
-    )
-    return start_idx, end_idx
+def find_level2_section(lines: list[str], scan: dict, heading_re: re.Pattern) -> Optional[Tuple[int, int]]:
+    level2_idx = scan["level2_idx"]
+    for pos, start_idx in enumerate(level2_idx):
+        if heading_re.match(lines[start_idx]):
+            end_idx = level2_idx[pos + 1] if pos + 1 < len(level2_idx) else len(lines)
+            return start_idx, end_idx
+    return None
 
 
-def check_section12_conclusions(report_text: str) -> list:
-    lines = report_text.splitlines()
-    loc = find_level2_section(lines, SECTION12_HEADING_RE)
+def check_section12_conclusions(lines: list, scan: dict) -> list:
+    loc = find_level2_section(lines, scan, SECTION12_HEADING_RE)
     if loc is None:
         return ["missing section heading `## 12 结论、证据与缺点`"]
 
@@ -339,12 +439,11 @@ def check_section12_conclusions(report_text: str) -> list:
     return issues
 
 
-def check_llm_reflection_section(report_text: str, summary_mode: str) -> list:
+def check_llm_reflection_section(lines: list, scan: dict, summary_mode: str) -> list:
     if summary_mode != "精读":
         return []
 
-    lines = report_text.splitlines()
-    loc = find_level2_section(lines, LLM_REFLECTION_HEADING_RE)
+    loc = find_level2_section(lines, scan, LLM_REFLECTION_HEADING_RE)
     if loc is None:
         return ["missing section heading `## 14 复盘评分与发表定位`"]
 
@@ -375,7 +474,7 @@ def check_llm_reflection_section(report_text: str, summary_mode: str) -> list:
             issues.append(f"section 14 {label} must not be `本文不涉及`")
 
         content_no_notes = FOOTNOTE_REF_RE.sub("", content)
-        score_match = re.match(r"^\s*(\d+(?:\.\d+)?)\s*(?:/10)?\s*", content_no_notes)
+        score_match = SCORE_HEAD_RE.match(content_no_notes)
         if not score_match:
             issues.append(f"section 14 {label} must start with a numeric score (0-10)")
             continue
@@ -388,8 +487,8 @@ def check_llm_reflection_section(report_text: str, summary_mode: str) -> list:
 
         # Require narrative beyond just the score.
         narrative = content_no_notes[score_match.end() :].strip()
-        narrative_clean = re.sub(r"\d+(?:\.\d+)?(?:\s*/\s*10)?", "", narrative)
-        narrative_clean = re.sub(r"[\s\W_]+", "", narrative_clean, flags=re.UNICODE)
+        narrative_clean = SCORE_NUMBER_RE.sub("", narrative)
+        narrative_clean = NON_WORD_RE.sub("", narrative_clean)
         if len(narrative_clean) < 10:
             issues.append(f"section 14 {label} must include a short narrative explanation beyond the score")
 
@@ -412,8 +511,7 @@ def check_llm_reflection_section(report_text: str, summary_mode: str) -> list:
             if venue_content == "本文不涉及":
                 issues.append("section 14 published-venue line must not be `本文不涉及`")
             venue_content_no_notes = FOOTNOTE_REF_RE.sub("", venue_content).strip()
-            venue_content_norm = venue_content_no_notes.lower()
-            if any(marker in venue_content_no_notes or marker in venue_content_norm for marker in PREPRINT_MARKERS):
+            if PREPRINT_MARKER_RE.search(venue_content_no_notes):
                 is_preprint = True
             if not FOOTNOTE_REF_CH14_RE.search(published_venue_line):
                 issues.append("section 14 published-venue line missing evidence footnote like [^14-1]")
@@ -429,17 +527,16 @@ def check_llm_reflection_section(report_text: str, summary_mode: str) -> list:
         else:
             tier_content = match.group(1).strip()
             tier_content_no_notes = FOOTNOTE_REF_RE.sub("", tier_content).strip()
-            tier_content_norm = tier_content_no_notes.lower()
 
             # If preprint, venue-tier evaluation is optional: allow blank/omitted.
-            if is_preprint and (not tier_content_no_notes or tier_content_no_notes == "本文不涉及" or any(m in tier_content_norm for m in PREPRINT_MARKERS)):
+            if is_preprint and (not tier_content_no_notes or tier_content_no_notes == "本文不涉及" or PREPRINT_MARKER_RE.search(tier_content_no_notes)):
                 pass
             else:
                 if not tier_content_no_notes:
                     issues.append("section 14 venue tier line is blank")
                 if tier_content_no_notes == "本文不涉及":
                     issues.append("section 14 venue tier line must not be `本文不涉及`")
-                if not any(token in tier_content_no_notes for token in ("顶级", "中等", "一般")):
+                if not TIER_LABEL_RE.search(tier_content_no_notes):
                     issues.append("section 14 venue tier line must state one of: 顶级 / 中等 / 一般")
                 if not FOOTNOTE_REF_CH14_RE.search(venue_tier_line):
                     issues.append("section 14 venue tier line missing evidence footnote like [^14-1]")
@@ -455,10 +552,9 @@ def check_llm_reflection_section(report_text: str, summary_mode: str) -> list:
         else:
             fit_content = match.group(1).strip()
             fit_content_no_notes = FOOTNOTE_REF_RE.sub("", fit_content).strip()
-            fit_content_norm = fit_content_no_notes.lower()
 
             # If preprint, venue-fit explanation is optional: allow blank/omitted.
-            if is_preprint and (not fit_content_no_notes or fit_content_no_notes == "本文不涉及" or any(m in fit_content_norm for m in PREPRINT_MARKERS)):
+            if is_preprint and (not fit_content_no_notes or fit_content_no_notes == "本文不涉及" or PREPRINT_MARKER_RE.search(fit_content_no_notes)):
                 pass
             else:
                 if not fit_content_no_notes:
@@ -472,7 +568,8 @@ def check_llm_reflection_section(report_text: str, summary_mode: str) -> list:
     publishability_idx = next((idx for idx, ln in enumerate(block) if PUBLISHABILITY_BULLET_RE.match(ln)), None)
 
     def _indent(line: str) -> int:
-        expanded = line.expandtabs(4)
+        # expandtabs allocates a new string; only pay for it when a tab is present.
+        expanded = line.expandtabs(4) if "\t" in line else line
         return len(expanded) - len(expanded.lstrip(" "))
 
     if publishability_idx is not None:
@@ -488,7 +585,7 @@ def check_llm_reflection_section(report_text: str, summary_mode: str) -> list:
         for ln in block[publishability_idx + 1 :]:
             if not ln.strip():
                 continue
-            if re.match(r"^\s*-\s+", ln) and _indent(ln) <= base_indent:
+            if BULLET_START_RE.match(ln) and _indent(ln) <= base_indent:
                 break
             parts.append(ln.strip())
 
@@ -501,12 +598,12 @@ def check_llm_reflection_section(report_text: str, summary_mode: str) -> list:
             if not FOOTNOTE_REF_CH14_RE.search(content_blob):
                 issues.append("section 14 publishability block missing evidence footnote like [^14-1]")
             content_no_notes = FOOTNOTE_REF_RE.sub("", content_blob)
-            missing_tiers = [tier for tier in ("顶级", "中等", "一般") if tier not in content_no_notes]
-            if missing_tiers:
+            tiers_present = set(TIER_LABEL_RE.findall(content_no_notes))
+            if len(tiers_present) < len(TIER_LABELS):
                 issues.append("section 14 publishability block must cover tiers: 顶级 / 中等 / 一般")
 
-            narrative_clean = re.sub(r"顶级|中等|一般", "", content_no_notes)
-            narrative_clean = re.sub(r"[\s\W_]+", "", narrative_clean, flags=re.UNICODE)
+            narrative_clean = TIER_LABEL_RE.sub("", content_no_notes)
+            narrative_clean = NON_WORD_RE.sub("", narrative_clean)
             if len(narrative_clean) < 20:
                 issues.append("section 14 publishability block must include brief reasoning, not just tier labels")
     else:
@@ -528,13 +625,133 @@ def check_llm_reflection_section(report_text: str, summary_mode: str) -> list:
         if not pub_tiers_found:
             issues.append("section 14 missing publishability reasoning (add `- 可发表性推演：...`)")
         else:
-            for tier in ("顶级", "中等", "一般"):
+            for tier in TIER_LABELS:
                 if tier not in pub_tiers_found:
                     issues.append(f"section 14 missing publishability line for tier: {tier}")
 
     return issues
 
 
+def _read_bytes_or_empty(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return b""
+
+
+def report_cache_key(
+    summary_path: Path, text: str, metadata: dict, summary_mode: str, min_chars: int, max_blank_fields: int
+) -> str:
+    # Content-addressed: the report text, metadata, template, options, and this checker's source all feed the key.
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (
+        str(summary_path).encode("utf-8"),
+        text.encode("utf-8"),
+        json.dumps(metadata, ensure_ascii=False, sort_keys=True, default=str).encode("utf-8"),
+        f"{summary_mode}|{min_chars}|{max_blank_fields}".encode("utf-8"),
+        _read_bytes_or_empty(template_path_for(summary_mode)),
+        _read_bytes_or_empty(Path(__file__).resolve()),
+    ):
+        # Length-prefix each part so adjacent parts cannot shift bytes between them.
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def load_report_cache(cache_path: Path, key: str) -> Optional[dict]:
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get("key") != key:
+        return None
+    return cached
+
+
+def store_report_cache(cache_path: Path, key: str, output: list, exit_code: int) -> None:
+    payload = {"key": key, "exit_code": exit_code, "output": output}
+    try:
+        cache_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def run_checks(
+    summary_path: Path, text: str, summary_mode: str, min_chars: int, max_blank_fields: int
+) -> Tuple[list, int]:
+    lines = text.splitlines()
+    scan = scan_report_lines(lines)
+    footnote_refs = extract_footnote_refs(text)
+    footnote_blocks = parse_footnote_blocks(lines, scan)
+    issues = []
+    template_path, expected_headings = load_template_headings(summary_mode)
+    actual_headings = scan["level2_headings"]
+
+    found_phrases = find_listed_phrases(text)
+
+    for token in PLACEHOLDER_TOKENS:
+        if token in found_phrases:
+            issues.append(f"contains placeholder token: {token}")
+
+    for phrase in DISALLOWED_PHRASES:
+        if phrase in found_phrases:
+            issues.append(f"contains disallowed phrase: {phrase}")
+
+    for tag in LEGACY_JUDGMENT_TAGS:
+        if tag in found_phrases:
+            issues.append(f"contains legacy judgment label: {tag}")
+
+    if OTHER_NOT_INVOLVED_RE.search(text):
+        issues.append("contains meaningless '其它:本文不涉及'; omit the `其它：` line when unused")
+
+    blank_fields = scan["blank_fields"]
+    if blank_fields > max_blank_fields:
+        issues.append(f"too many blank fields: {blank_fields} > {max_blank_fields}")
+
+    if len(text.strip()) < min_chars:
+        issues.append(f"too short: {len(text.strip())} < min_chars({min_chars})")
+
+    issues.extend(
+        itertools.chain(
+            check_section_heading_integrity(scan, expected_headings),
+            check_footnote_section_placement(scan),
+            check_figure_section_format(lines, scan),
+            check_footnote_integrity(text, footnote_refs, footnote_blocks),
+            check_markdown_media_syntax(text),
+            check_missing_wording(lines, scan),
+        )
+    )
+    if len(issues) >= FAIL_FAST_ISSUE_LIMIT:
+        issues.append(f"skipped section 12/14 checks: {len(issues)} issues already found; fix those first")
+    else:
+        issues.extend(
+            itertools.chain(
+                check_section12_conclusions(lines, scan),
+                check_llm_reflection_section(lines, scan, summary_mode),
+            )
+        )
+    footnote_defs = set(footnote_blocks.keys())
+
+    output = [
+        f"summary_file={summary_path}",
+        f"summary_mode={summary_mode}",
+        f"heading_template={template_path}",
+        f"section_headings={len(actual_headings)}",
+        f"min_chars={min_chars}",
+        f"chars={len(text.strip())}",
+        f"blank_fields={blank_fields}",
+        f"footnote_refs={len(footnote_refs)}",
+        f"footnote_defs={len(footnote_defs)}",
+    ]
+    if issues:
+        output.append("[FAIL] report still looks like template:")
+        output.extend(f"- {issue}" for issue in issues)
+        return output, 2
+
+    output.append("[OK] report looks finalized.")
+    return output, 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Check if summary report is still template-like.")
     parser.add_argument("--artifact-dir", required=True, help="Paper artifact directory.")
@@ -550,6 +767,14 @@ def main() -> int:
         default=12,
         help="Fail when blank field bullets exceed this threshold.",
     )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help=(
+            f"Reuse the result stored in {REPORT_CACHE_NAME} in the artifact dir when the report, metadata, "
+            "template, options and checker are unchanged (off by default)."
+        ),
+    )
     args = parser.parse_args()
 
     artifact_dir = Path(args.artifact_dir).expanduser().resolve()
@@ -561,67 +786,25 @@ def main() -> int:
     if not summary_path.exists():
         raise SystemExit(f"[ERROR] summary report not found: {summary_path}")
 
-    text = summary_path.read_text(encoding="utf-8")
-    issues = []
     summary_mode = normalize_summary_mode(str(metadata.get("summary_mode", "精读")))
-    template_path, expected_headings = load_template_headings(summary_mode)
-    actual_headings = extract_level2_headings(text)
     min_chars = args.min_chars if args.min_chars > 0 else (600 if summary_mode == "略读" else 1800)
 
-    for token in PLACEHOLDER_TOKENS:
-        if token in text:
-            issues.append(f"contains placeholder token: {token}")
-
-    for phrase in DISALLOWED_PHRASES:
-        if phrase in text:
-            issues.append(f"contains disallowed phrase: {phrase}")
-
-    for tag in LEGACY_JUDGMENT_TAGS:
-        if tag in text:
-            issues.append(f"contains legacy judgment label: {tag}")
-
-    if OTHER_NOT_INVOLVED_RE.search(text):
-        issues.append("contains meaningless '其它:本文不涉及'; omit the `其它：` line when unused")
-
-    blank_fields = sum(
-        1
-        for ln in text.splitlines()
-        if BLANK_FIELD_RE.match(ln) or BLANK_NUMBERED_FIELD_RE.match(ln) or BLANK_CLAIM_RE.match(ln)
-    )
-    if blank_fields > args.max_blank_fields:
-        issues.append(f"too many blank fields: {blank_fields} > {args.max_blank_fields}")
-
-    if len(text.strip()) < min_chars:
-        issues.append(f"too short: {len(text.strip())} < min_chars({min_chars})")
-
-    issues.extend(check_section_heading_integrity(text, expected_headings))
-    issues.extend(check_footnote_section_placement(text))
-    issues.extend(check_figure_section_format(text))
-    issues.extend(check_footnote_integrity(text))
-    issues.extend(check_markdown_media_syntax(text))
-    issues.extend(check_missing_wording(text))
-    issues.extend(check_section12_conclusions(text))
-    issues.extend(check_llm_reflection_section(text, summary_mode))
-    footnote_refs = extract_footnote_refs(text)
-    footnote_defs = set(parse_footnote_blocks(text).keys())
-
-    print(f"summary_file={summary_path}")
-    print(f"summary_mode={summary_mode}")
-    print(f"heading_template={template_path}")
-    print(f"section_headings={len(actual_headings)}")
-    print(f"min_chars={min_chars}")
-    print(f"chars={len(text.strip())}")
-    print(f"blank_fields={blank_fields}")
-    print(f"footnote_refs={len(footnote_refs)}")
-    print(f"footnote_defs={len(footnote_defs)}")
-    if issues:
-        print("[FAIL] report still looks like template:")
-        for issue in issues:
-            print(f"- {issue}")
-        return 2
+    text = read_report_text(summary_path)
+    cache_path = artifact_dir / REPORT_CACHE_NAME
+    cache_key = ""
+    cached = None
+    if args.cache:
+        cache_key = report_cache_key(summary_path, text, metadata, summary_mode, min_chars, args.max_blank_fields)
+        cached = load_report_cache(cache_path, cache_key)
+    if cached is not None:
+        output, exit_code = cached["output"], cached["exit_code"]
+    else:
+        output, exit_code = run_checks(summary_path, text, summary_mode, min_chars, args.max_blank_fields)
+        if args.cache:
+            store_report_cache(cache_path, cache_key, output, exit_code)
 
-    print("[OK] report looks finalized.")
-    return 0
+    print("\n".join(output))
+    return exit_code
 
 
 if __name__ == "__main__":
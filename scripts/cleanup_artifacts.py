@@ -9,89 +9,158 @@ Supports:
 
 import argparse
 import json
+import os
 import re
 import shutil
 from pathlib import Path
-from typing import List, Optional, Set
-
-
-LEGACY_SUFFIX_RE = re.compile(
-    r"^(?P<prefix>.+)_(?:fulltext\.txt|metadata\.json|urls_all\.txt|url_hits\.json|"
-    r"resource_links(?:_priority)?\.json|figure_captions\.json|table_captions\.json|"
-    r"code_signals\.json|availability_snippets\.json|tables\.json|images_manifest\.json|"
-    r"image_gallery\.md)$"
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+LEGACY_SUFFIXES = (
+    "_fulltext.txt",
+    "_metadata.json",
+    "_urls_all.txt",
+    "_url_hits.json",
+    "_resource_links.json",
+    "_resource_links_priority.json",
+    "_figure_captions.json",
+    "_table_captions.json",
+    "_code_signals.json",
+    "_availability_snippets.json",
+    "_tables.json",
+    "_images_manifest.json",
+    "_image_gallery.md",
 )
-LEGACY_IMAGE_DIR_RE = re.compile(r"^(?P<prefix>.+)_images$")
+LEGACY_IMAGE_DIR_SUFFIX = "_images"
+REMOVE_WORKERS = 8
 MD_IMAGE_LINE_RE = re.compile(r"^\s*!\[[^\]]*\]\([^)]+\)\s*$")
 
 
-def detect_flat_prefixes(target_dir: Path) -> List[str]:
+def strip_legacy_suffix(name: str, suffixes: tuple) -> Optional[str]:
+    # No legacy suffix is a tail of another, so the first hit is the only one.
+    for suffix in suffixes:
+        if name.endswith(suffix) and len(name) > len(suffix):
+            return name[: -len(suffix)]
+    return None
+
+
+# DirEntry objects keep their cached d_type, so one listing serves both detection and collection.
+def list_dir_entries(target_dir: Path) -> List[os.DirEntry]:
+    with os.scandir(target_dir) as entries:
+        return list(entries)
+
+
+def detect_flat_prefixes(entries: List[os.DirEntry]) -> List[str]:
     prefixes: Set[str] = set()
-    for item in target_dir.iterdir():
-        if item.is_file():
-            m = LEGACY_SUFFIX_RE.match(item.name)
-            if m:
-                prefixes.add(m.group("prefix"))
-        elif item.is_dir():
-            m = LEGACY_IMAGE_DIR_RE.match(item.name)
-            if m:
-                prefixes.add(m.group("prefix"))
+    # DirEntry type checks use the cached d_type; only symlinks need a stat to follow them.
+    for entry in entries:
+        if entry.is_file():
+            prefix = strip_legacy_suffix(entry.name, LEGACY_SUFFIXES)
+            if prefix:
+                prefixes.add(prefix)
+        elif entry.is_dir():
+            prefix = strip_legacy_suffix(entry.name, (LEGACY_IMAGE_DIR_SUFFIX,))
+            if prefix:
+                prefixes.add(prefix)
     return sorted(prefixes)
 
 
-def collect_paths_for_prefix(target_dir: Path, prefix: str) -> List[Path]:
-    candidates: List[Path] = []
-    bundle_dir = target_dir / prefix
-    if bundle_dir.exists() and bundle_dir.is_dir():
-        candidates.append(bundle_dir)
+# Entries to delete carry the DirEntry type so removal doesn't stat them again.
+def delete_item(entry: os.DirEntry) -> Tuple[str, bool]:
+    return entry.path, entry.is_dir(follow_symlinks=False)
+
 
-    for item in target_dir.glob(f"{prefix}_*"):
-        if item.exists():
-            candidates.append(item)
-    return sorted(set(candidates))
+# Maps each prefix to its bundle dir and `<prefix>_*` entries from the shared directory listing.
+def build_prefix_index(entries: List[os.DirEntry], prefixes: Set[str]) -> Dict[str, List[Tuple[str, bool]]]:
+    index: Dict[str, List[Tuple[str, bool]]] = {prefix: [] for prefix in prefixes}
+    for entry in entries:
+        name = entry.name
+        if name in index and entry.is_dir():
+            index[name].append(delete_item(entry))
+        # `<prefix>_*` can only match where the name has an underscore; try each one.
+        pos = name.find("_")
+        while pos != -1:
+            bucket = index.get(name[:pos])
+            if bucket is not None:
+                bucket.append(delete_item(entry))
+            pos = name.find("_", pos + 1)
+    return index
 
 
-def remove_path(path: Path, dry_run: bool) -> None:
+def remove_path(path: str, is_dir: bool, dry_run: bool) -> None:
     if dry_run:
         return
-    if path.is_dir():
+    # is_dir comes from the scan without following symlinks, so symlinked dirs are unlinked, not rmtree'd.
+    if is_dir:
         shutil.rmtree(path, ignore_errors=True)
-    else:
-        path.unlink(missing_ok=True)
+        return
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def remove_paths(items: List[Tuple[str, bool]], dry_run: bool) -> None:
+    if dry_run or not items:
+        return
+    # Imported here: concurrent.futures pulls in threading/logging, which dry runs never need.
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Deletions are syscall-bound; independent subtrees can be removed concurrently.
+    with ThreadPoolExecutor(max_workers=min(REMOVE_WORKERS, len(items))) as pool:
+        list(pool.map(lambda item: remove_path(item[0], item[1], dry_run), items))
 
 
 def strip_image_links_in_report(report_path: Path, dry_run: bool) -> None:
-    lines = report_path.read_text(encoding="utf-8").splitlines()
-    cleaned = [ln for ln in lines if not MD_IMAGE_LINE_RE.match(ln)]
     if dry_run:
         return
-    report_path.write_text("\n".join(cleaned).rstrip() + "\n", encoding="utf-8")
+
+    text = report_path.read_text(encoding="utf-8")
+    lines = text.splitlines()
+    if "![" in text:
+        # Only lines starting with `![` (after indentation) can be image lines; skip the regex for the rest.
+        lines = [ln for ln in lines if not (ln.lstrip().startswith("![") and MD_IMAGE_LINE_RE.match(ln))]
+    report_path.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
 
 
 def resolve_final_report_path(target_dir: Path, report_name: str) -> Path:
+    # Returns a resolved path; callers pass an already-resolved target_dir.
     report_raw = str(report_name or "").strip()
     if report_raw and report_raw.lower() != "auto":
         return (target_dir / report_raw).resolve()
 
-    metadata_path = target_dir / "metadata.json"
-    if metadata_path.exists():
+    try:
+        data = (target_dir / "metadata.json").read_bytes()
+    except OSError:
+        data = None
+    if data is not None:
         try:
-            metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+            if orjson is not None:
+                metadata = orjson.loads(data)
+            else:
+                metadata = json.loads(data)
         except Exception:
             metadata = {}
         summary_raw = str(metadata.get("summary_file", "")).strip()
         if summary_raw:
-            summary_path = Path(summary_raw).expanduser().resolve()
-            try:
-                summary_path.relative_to(target_dir.resolve())
-            except Exception:
-                pass
-            else:
-                return summary_path
-
-    candidates = sorted(target_dir.glob("*阅读总结.md"))
+            # Both sides are resolved, so containment is a string prefix test; no relative_to exception.
+            summary_str = os.path.realpath(os.path.expanduser(summary_raw))
+            target_str = os.fspath(target_dir)
+            if summary_str == target_str or summary_str.startswith(os.path.join(target_str, "")):
+                return Path(summary_str)
+
+    # Candidates are siblings, so sorting the path strings orders them by name without Path objects.
+    with os.scandir(target_dir) as entries:
+        candidates = sorted(
+            entry.path for entry in entries if entry.name.endswith("阅读总结.md") and entry.is_file()
+        )
     if len(candidates) == 1:
-        return candidates[0].resolve()
+        return Path(os.path.realpath(candidates[0]))
     if not candidates:
         raise SystemExit(
             "[ERROR] could not auto-detect report. Pass --report-name <report.md> or keep metadata.json."
@@ -159,7 +228,9 @@ def main() -> int:
         if not report_path.exists():
             raise SystemExit(f"[ERROR] report not found: {report_path}")
 
-        keep_paths = {report_path.resolve()}
+        # report_path and target_dir are already resolved; don't re-resolve them below.
+        keep_paths = {report_path}
+        target_str = os.fspath(target_dir)
         images_dir = target_dir / "images"
         if images_dir.exists() and images_dir.is_dir() and not args.drop_images_dir:
             keep_paths.add(images_dir.resolve())
@@ -170,13 +241,23 @@ def main() -> int:
                 continue
             keep_path = (target_dir / keep_rel).resolve()
             try:
-                keep_path.relative_to(target_dir.resolve())
-            except Exception:
+                inside = os.path.commonpath([keep_path, target_dir]) == target_str
+            except ValueError:
+                # Different drives (Windows) or mixed absolute/relative paths: not under target_dir.
+                inside = False
+            if not inside:
                 raise SystemExit(f"[ERROR] --keep-file must be under target-dir: {keep_rel}")
             if keep_path.exists():
                 keep_paths.add(keep_path)
 
-        to_delete = [p for p in target_dir.iterdir() if p.resolve() not in keep_paths]
+        keep_strs = {os.fspath(p) for p in keep_paths}
+        to_delete = []
+        with os.scandir(target_dir) as entries:
+            for entry in entries:
+                # Children of the resolved target_dir are already canonical unless they are symlinks.
+                entry_path = os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+                if entry_path not in keep_strs:
+                    to_delete.append(delete_item(entry))
         print(f"target_dir={target_dir}")
         print(f"dry_run={args.dry_run}")
         print("mode=final-md-only")
@@ -186,9 +267,10 @@ def main() -> int:
             print(f"keep_file={args.keep_file}")
         print(f"strip_image_links={args.strip_image_links}")
         print(f"paths_to_delete={len(to_delete)}")
-        for path in sorted(to_delete):
+        to_delete.sort()
+        for path, _ in to_delete:
             print(f"- {path}")
-            remove_path(path, args.dry_run)
+        remove_paths(to_delete, args.dry_run)
 
         if args.strip_image_links:
             print(f"strip_image_links_from={report_path}")
@@ -200,9 +282,10 @@ def main() -> int:
             print("[OK] final-md-only cleanup complete.")
         return 0
 
+    entries = list_dir_entries(target_dir)
     delete_prefixes: Set[str] = {p.strip() for p in args.delete_prefix if p.strip()}
     if args.auto_delete_flat:
-        delete_prefixes.update(detect_flat_prefixes(target_dir))
+        delete_prefixes.update(detect_flat_prefixes(entries))
 
     keep_prefixes: Set[str] = {p.strip() for p in args.keep_prefix if p.strip()}
     delete_prefixes -= keep_prefixes
@@ -211,12 +294,14 @@ def main() -> int:
         print("[INFO] nothing to delete.")
         return 0
 
-    to_delete: List[Path] = []
+    prefix_index = build_prefix_index(entries, delete_prefixes)
+    to_delete: List[Tuple[str, bool]] = []
     for prefix in sorted(delete_prefixes):
-        to_delete.extend(collect_paths_for_prefix(target_dir, prefix))
+        to_delete.extend(prefix_index[prefix])
 
-    # Keep only unique paths.
-    unique_paths = sorted(set(to_delete))
+    # Entries shared by overlapping prefixes appear once; the listing is sorted once for display.
+    unique_paths = list(dict.fromkeys(to_delete))
+    unique_paths.sort()
     if not unique_paths:
         print("[INFO] no matching artifact paths found.")
         return 0
@@ -225,9 +310,9 @@ def main() -> int:
     print(f"dry_run={args.dry_run}")
     print(f"delete_prefixes={sorted(delete_prefixes)}")
     print(f"paths_to_delete={len(unique_paths)}")
-    for path in unique_paths:
+    for path, _ in unique_paths:
         print(f"- {path}")
-        remove_path(path, args.dry_run)
+    remove_paths(unique_paths, args.dry_run)
 
     if args.dry_run:
         print("[OK] dry-run complete.")
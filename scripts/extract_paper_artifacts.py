@@ -8,31 +8,49 @@ Outputs include:
 - figure/table caption candidates
 - code-like signal lines
 - data-availability snippets
-- optional table extraction (pdfplumber)
+- optional table extraction (pymupdf, or pdfplumber without it)
 - optional image extraction (pymupdf)
+
+Page text and link URLs come from PyMuPDF when it is installed (pypdf otherwise).
 """
 
 import argparse
+import functools
+import hashlib
+import importlib.util
 import json
+import math
+import multiprocessing
+import os
 import re
 import shutil
 import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 from pypdf import PdfReader
 
-try:
-    import pdfplumber  # type: ignore
-except ImportError:
-    pdfplumber = None
+# pdfplumber is only the table fallback when PyMuPDF is missing, so it is imported on first use.
+HAS_PDFPLUMBER = importlib.util.find_spec("pdfplumber") is not None
 
 try:
     import fitz  # type: ignore
 except ImportError:
     fitz = None
 
+# Newer PyMuPDF prints a layout-package hint from find_tables(); keep stdout to our report.
+if fitz is not None and hasattr(fitz, "no_recommend_layout"):
+    fitz.no_recommend_layout()
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
 
 URL_RE = re.compile(r"https?://[^\s<>\]})\"']+")
 FIGURE_CAPTION_RE = re.compile(
@@ -44,14 +62,21 @@ TABLE_CAPTION_RE = re.compile(
     r"^\s*(?:TABLE\s*[A-Za-z0-9]+\s+.+|(?:Table|Tab\.|TAB\.)\s*[A-Za-z0-9]+(\s*\||\s*[:.])\s+.+)"
 )
 CITATION_STEM_RE = re.compile(r"^[^-]{1,80}\s-\s\d{4}\s-\s[^-]{1,120}\s-\s(.+)$")
-CODE_SIGNAL_RE = re.compile(
-    r"(Algorithm\s*\d+|pseudocode|code availability|source code|GitHub|gitlab|docker|conda|pip install|python\s+)",
-    re.IGNORECASE,
+# Lowercase alternatives shared by both code-signal patterns below.
+CODE_SIGNAL_PATTERN = (
+    r"(algorithm\s*\d+|pseudocode|code availability|source code|github|gitlab|docker|conda|pip install|python\s+)"
 )
+CODE_SIGNAL_RE = re.compile(CODE_SIGNAL_PATTERN, re.IGNORECASE)
+DOI_PATH_RE = re.compile(r"^/10\.\S+")
+# IGNORECASE alternations are slow to scan; for ASCII lines, searching the lowered line is equivalent.
+CODE_SIGNAL_LOWER_RE = re.compile(CODE_SIGNAL_PATTERN)
 AVAILABILITY_SIGNAL_RE = re.compile(
     r"(data availability|code availability|availability statement|source code|repository|zenodo|bioproject|sra)",
     re.IGNORECASE,
 )
+MAX_RENDER_WORKERS = 8
+# Bump when extract_tables() output changes so --tables-cache entries from older versions are not reused.
+TABLES_CACHE_FORMAT = 1
 
 
 def normalize_name(raw: str) -> str:
@@ -93,6 +118,10 @@ def write_text(path: Path, content: str) -> None:
 
 
 def write_json(path: Path, obj: object) -> None:
+    # orjson emits the same indent=2 UTF-8 layout from C; int keys are stringified like json does.
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
     path.write_text(json.dumps(obj, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
@@ -170,6 +199,12 @@ def write_image_gallery(path: Path, manifest: List[Dict[str, object]]) -> None:
     write_text(path, "\n".join(lines).rstrip() + "\n")
 
 
+def has_code_signal(line: str) -> bool:
+    if line.isascii():
+        return CODE_SIGNAL_LOWER_RE.search(line.lower()) is not None
+    return CODE_SIGNAL_RE.search(line) is not None
+
+
 def extract_annotation_urls(page) -> List[str]:
     urls: List[str] = []
     annots = page.get("/Annots")
@@ -189,12 +224,42 @@ def extract_annotation_urls(page) -> List[str]:
     return urls
 
 
+def extract_link_urls(page) -> List[str]:
+    urls: List[str] = []
+    try:
+        links = page.get_links()
+    except Exception:
+        return urls
+
+    for link in links:
+        uri = str(link.get("uri") or "").strip()
+        if uri.startswith("http://") or uri.startswith("https://"):
+            urls.append(uri)
+    return urls
+
+
+def iter_page_texts(reader: PdfReader, doc) -> Iterator[Tuple[int, str, List[str]]]:
+    # PyMuPDF extracts page text much faster than pypdf; fall back to pypdf when it is not installed.
+    if doc is not None:
+        for page_idx, page in enumerate(doc, start=1):
+            yield page_idx, page.get_text("text"), extract_link_urls(page)
+        return
+    for page_idx, page in enumerate(reader.pages, start=1):
+        yield page_idx, page.extract_text() or "", extract_annotation_urls(page)
+
+
 def clean_url(url: str) -> str:
     return url.rstrip(".,;:)")
 
 
+# The same URLs recur across pages and are parsed again when categorized; parse each one once.
+@functools.lru_cache(maxsize=4096)
+def parse_url(url: str):
+    return urlparse(url)
+
+
 def is_usable_url(url: str) -> bool:
-    parsed = urlparse(url)
+    parsed = parse_url(url)
     host = parsed.netloc.lower()
     path = parsed.path or ""
     if parsed.scheme not in {"http", "https"}:
@@ -204,7 +269,7 @@ def is_usable_url(url: str) -> bool:
     if url in {"https://doi", "https://doi.org/", "https://doi.org/10"}:
         return False
     if host == "doi.org":
-        if not re.match(r"^/10\.\S+", path):
+        if not DOI_PATH_RE.match(path):
             return False
         if path.endswith("-") or path.endswith("/"):
             return False
@@ -212,7 +277,7 @@ def is_usable_url(url: str) -> bool:
 
 
 def categorize_url(url: str, context: str) -> str:
-    host = (urlparse(url).netloc or "").lower()
+    host = (parse_url(url).netloc or "").lower()
     full = f"{host} {url.lower()} {context.lower()}"
 
     if any(token in full for token in ["github.com", "gitlab.com", "bitbucket.org", "source code", "docker"]):
@@ -226,127 +291,215 @@ def categorize_url(url: str, context: str) -> str:
     return "other"
 
 
-def collect_section_snippets(page_lines: List[Tuple[int, List[str]]], window: int = 3) -> List[Dict[str, object]]:
+# Snippet windows never cross a page boundary, so pages are scanned as they are extracted.
+def collect_section_snippets(page_no: int, lines: List[str], window: int = 3) -> List[Dict[str, object]]:
     snippets: List[Dict[str, object]] = []
-    for page_no, lines in page_lines:
-        for idx, line in enumerate(lines):
-            if AVAILABILITY_SIGNAL_RE.search(line):
-                start = max(0, idx - window)
-                end = min(len(lines), idx + window + 1)
-                snippets.append(
-                    {
-                        "page": page_no,
-                        "trigger_line": line.strip(),
-                        "snippet": " ".join(l.strip() for l in lines[start:end] if l.strip()),
-                    }
-                )
+    availability_search = AVAILABILITY_SIGNAL_RE.search
+    for idx, line in enumerate(lines):
+        if availability_search(line):
+            start = max(0, idx - window)
+            end = min(len(lines), idx + window + 1)
+            snippets.append(
+                {
+                    "page": page_no,
+                    "trigger_line": line.strip(),
+                    "snippet": " ".join(l.strip() for l in lines[start:end] if l.strip()),
+                }
+            )
     return snippets
 
 
+# In sorted order every URL extending a parent comes right after it, so one neighbour check suffices.
 def collapse_parent_urls(urls: Set[str]) -> List[str]:
-    reduced = set(urls)
-    for url in list(reduced):
-        if url.endswith("/") and any(other != url and other.startswith(url) for other in reduced):
-            reduced.discard(url)
-    return sorted(reduced)
-
+    ordered = sorted(urls)
+    return [
+        url
+        for url, following in zip(ordered, ordered[1:] + [""])
+        if not (url.endswith("/") and following.startswith(url))
+    ]
+
+
+def iter_page_tables(pdf_path: Path, doc) -> Iterator[Tuple[int, List[List[object]]]]:
+    # Reuse the open PyMuPDF document when available; pdfplumber would parse the whole PDF again.
+    if doc is not None:
+        for page_idx, page in enumerate(doc, start=1):
+            # One malformed page must not cost the tables of every other page.
+            try:
+                tables = [table.extract() for table in page.find_tables().tables]
+            except Exception:
+                tables = []
+            yield page_idx, tables
+        return
+    if not HAS_PDFPLUMBER:
+        return
+    try:
+        import pdfplumber  # type: ignore
+    except ImportError:
+        return
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        for page_idx, page in enumerate(pdf.pages, start=1):
+            yield page_idx, page.extract_tables() or []
 
-def extract_tables(pdf_path: Path) -> List[Dict[str, object]]:
-    if pdfplumber is None:
-        return []
 
+def extract_tables(pdf_path: Path, doc=None) -> List[Dict[str, object]]:
     table_results: List[Dict[str, object]] = []
-    with pdfplumber.open(str(pdf_path)) as pdf:
-        for page_idx, page in enumerate(pdf.pages, start=1):
-            tables = page.extract_tables() or []
-            for table_idx, table in enumerate(tables, start=1):
-                cleaned_rows = []
-                for row in table:
-                    if row is None:
-                        continue
-                    cleaned_rows.append([cell.strip() if isinstance(cell, str) else cell for cell in row])
-                table_results.append(
-                    {
-                        "page": page_idx,
-                        "table_index": table_idx,
-                        "rows": cleaned_rows,
-                        "n_rows": len(cleaned_rows),
-                        "n_cols": max((len(r) for r in cleaned_rows), default=0),
-                    }
-                )
+    for page_idx, tables in iter_page_tables(pdf_path, doc):
+        for table_idx, table in enumerate(tables, start=1):
+            cleaned_rows = []
+            for row in table:
+                if row is None:
+                    continue
+                cleaned_rows.append([cell.strip() if isinstance(cell, str) else cell for cell in row])
+            table_results.append(
+                {
+                    "page": page_idx,
+                    "table_index": table_idx,
+                    "rows": cleaned_rows,
+                    "n_rows": len(cleaned_rows),
+                    "n_cols": max((len(r) for r in cleaned_rows), default=0),
+                }
+            )
     return table_results
 
 
+def tables_cache_key(pdf_path: Path, doc) -> Optional[str]:
+    # Same PDF bytes, table backend version, and cache format give the same tables; None when no backend exists.
+    if doc is not None:
+        backend = f"pymupdf-{fitz.VersionBind}"
+    elif HAS_PDFPLUMBER:
+        # Only --tables-cache needs package metadata, so its import stays off the default path.
+        import importlib.metadata
+
+        try:
+            backend = f"pdfplumber-{importlib.metadata.version('pdfplumber')}"
+        except importlib.metadata.PackageNotFoundError:
+            backend = "pdfplumber-unknown"
+    else:
+        return None
+    digest = hashlib.blake2b(digest_size=16)
+    with pdf_path.open("rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    digest.update(f"|{backend}|{TABLES_CACHE_FORMAT}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_tables_cache(cache_path: Path) -> Optional[List[Dict[str, object]]]:
+    try:
+        cached = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    return cached if isinstance(cached, list) else None
+
+
+def store_tables_cache(cache_path: Path, tables: List[Dict[str, object]]) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(cache_path, tables)
+    except OSError:
+        pass
+
+
 def extract_embedded_images(
-    pdf_path: Path,
+    doc,
     image_dir: Path,
     prefix: str,
     min_width: int,
     min_height: int,
     min_area: int,
     skip_pages: Optional[Set[int]] = None,
+    max_dim: int = 0,
 ) -> List[Dict[str, object]]:
-    if fitz is None:
+    if doc is None:
         return []
 
     image_dir.mkdir(parents=True, exist_ok=True)
+    page_count = len(doc)
+    # Hybrid runs that render every page have nothing left to decode here.
+    if skip_pages and skip_pages.issuperset(range(1, page_count + 1)):
+        return []
     manifest: List[Dict[str, object]] = []
-    doc = fitz.open(str(pdf_path))
-    try:
-        for page_idx in range(len(doc)):
-            if skip_pages and (page_idx + 1) in skip_pages:
-                continue
-            page = doc[page_idx]
-            images = page.get_images(full=True)
-            for img_idx, img in enumerate(images, start=1):
-                xref = img[0]
+    # Logos and headers repeat the same xref on many pages: decode once, then copy the saved PNG.
+    # None marks an xref that failed to decode or fell below the size filters.
+    saved_by_xref: Dict[int, Optional[Dict[str, object]]] = {}
+    for page_idx in range(page_count):
+        if skip_pages and (page_idx + 1) in skip_pages:
+            continue
+        page = doc[page_idx]
+        images = page.get_images(full=True)
+        for img_idx, img in enumerate(images, start=1):
+            xref = img[0]
+            filename = f"{prefix}_p{page_idx + 1:03d}_img{img_idx:03d}_xref{xref}.png"
+            out_path = image_dir / filename
+            if xref in saved_by_xref:
+                first = saved_by_xref[xref]
+                if first is None:
+                    continue
                 try:
-                    pix = fitz.Pixmap(doc, xref)
-                except Exception:
+                    shutil.copyfile(str(first["path"]), str(out_path))
+                except OSError:
                     continue
+                manifest.append(
+                    dict(
+                        first,
+                        page=page_idx + 1,
+                        image_index=img_idx,
+                        size_bytes=out_path.stat().st_size if out_path.exists() else 0,
+                        path=str(out_path),
+                    )
+                )
+                continue
+            saved_by_xref[xref] = None
+            try:
+                pix = fitz.Pixmap(doc, xref)
+            except Exception:
+                continue
 
-                width = int(getattr(pix, "width", 0) or 0)
-                height = int(getattr(pix, "height", 0) or 0)
-                if width < min_width or height < min_height or (width * height) < min_area:
-                    pix = None
-                    continue
+            width = int(getattr(pix, "width", 0) or 0)
+            height = int(getattr(pix, "height", 0) or 0)
+            if width < min_width or height < min_height or (width * height) < min_area:
+                pix = None
+                continue
 
-                color_channels = int(getattr(pix, "n", 0) or 0) - int(bool(getattr(pix, "alpha", False)))
-                if color_channels > 3:
-                    try:
-                        pix_rgb = fitz.Pixmap(fitz.csRGB, pix)
-                    except Exception:
-                        pix = None
-                        continue
-                    pix = pix_rgb
-                    width = int(getattr(pix, "width", 0) or width)
-                    height = int(getattr(pix, "height", 0) or height)
+            # Halve oversized images in place before the RGB conversion and PNG encode, which scale with pixels.
+            if max_dim > 0 and max(width, height) >= 2 * max_dim:
+                pix.shrink(int(math.log2(max(width, height) / max_dim)))
+                width = int(getattr(pix, "width", 0) or width)
+                height = int(getattr(pix, "height", 0) or height)
 
-                filename = f"{prefix}_p{page_idx + 1:03d}_img{img_idx:03d}_xref{xref}.png"
-                out_path = image_dir / filename
+            color_channels = int(getattr(pix, "n", 0) or 0) - int(bool(getattr(pix, "alpha", False)))
+            if color_channels > 3:
                 try:
-                    pix.save(str(out_path))
+                    pix_rgb = fitz.Pixmap(fitz.csRGB, pix)
                 except Exception:
                     pix = None
                     continue
-                manifest.append(
-                    {
-                        "source": "embedded",
-                        "page": page_idx + 1,
-                        "image_index": img_idx,
-                        "xref": xref,
-                        "ext": "png",
-                        "width": width,
-                        "height": height,
-                        "alpha": bool(getattr(pix, "alpha", False)),
-                        "colorspace": str(getattr(getattr(pix, "colorspace", None), "name", "") or ""),
-                        "size_bytes": out_path.stat().st_size if out_path.exists() else 0,
-                        "path": str(out_path),
-                    }
-                )
+                pix = pix_rgb
+                width = int(getattr(pix, "width", 0) or width)
+                height = int(getattr(pix, "height", 0) or height)
+
+            try:
+                pix.save(str(out_path))
+            except Exception:
                 pix = None
-    finally:
-        doc.close()
+                del saved_by_xref[xref]
+                continue
+            entry: Dict[str, object] = {
+                "source": "embedded",
+                "page": page_idx + 1,
+                "image_index": img_idx,
+                "xref": xref,
+                "ext": "png",
+                "width": width,
+                "height": height,
+                "alpha": bool(getattr(pix, "alpha", False)),
+                "colorspace": str(getattr(getattr(pix, "colorspace", None), "name", "") or ""),
+                "size_bytes": out_path.stat().st_size if out_path.exists() else 0,
+                "path": str(out_path),
+            }
+            saved_by_xref[xref] = entry
+            manifest.append(entry)
+            pix = None
     return manifest
 
 
@@ -389,9 +542,15 @@ def find_caption_line_rects(page) -> List["fitz.Rect"]:
             continue
         for line in block.get("lines", []):
             spans = line.get("spans", [])
-            text = "".join(str(span.get("text", "")) for span in spans).strip()
-            if not text:
+            # Captions start with "F" (Figure/Fig.) or "T" (Table/Tab.); skip the join and regexes otherwise.
+            first = ""
+            for span in spans:
+                first = str(span.get("text", "")).lstrip()[:1]
+                if first:
+                    break
+            if first != "F" and first != "T":
                 continue
+            text = "".join(str(span.get("text", "")) for span in spans).strip()
             if FIGURE_CAPTION_RE.match(text) or TABLE_CAPTION_RE.match(text):
                 bbox = line.get("bbox")
                 if bbox and len(bbox) == 4:
@@ -412,10 +571,9 @@ def rect_area(rect) -> float:
     return float(rect.width) * float(rect.height)
 
 
-def horizontal_overlap_ratio(a, b) -> float:
-    inter = max(0.0, min(float(a.x1), float(b.x1)) - max(float(a.x0), float(b.x0)))
-    denom = max(1.0, min(float(a.width), float(b.width)))
-    return inter / denom
+# Dedup key on a 0.1pt grid; integer round() avoids the slower round(x, 1) and hashes ints.
+def rect_key(rect) -> Tuple[int, int, int, int]:
+    return (round(rect.x0 * 10), round(rect.y0 * 10), round(rect.x1 * 10), round(rect.y1 * 10))
 
 
 def collect_visual_rects(
@@ -429,7 +587,7 @@ def collect_visual_rects(
     page_rect = page.rect
     page_area = max(1.0, float(page_rect.width) * float(page_rect.height))
     rects: List["fitz.Rect"] = []
-    seen: Set[Tuple[float, float, float, float]] = set()
+    seen: Set[Tuple[int, int, int, int]] = set()
 
     try:
         page_images = page.get_images(full=True) or []
@@ -447,7 +605,7 @@ def collect_visual_rects(
                     continue
             except Exception:
                 continue
-            key = (round(rect.x0, 1), round(rect.y0, 1), round(rect.x1, 1), round(rect.y1, 1))
+            key = rect_key(rect)
             if key in seen:
                 continue
             seen.add(key)
@@ -466,7 +624,7 @@ def collect_visual_rects(
                 continue
         except Exception:
             continue
-        key = (round(rect.x0, 1), round(rect.y0, 1), round(rect.x1, 1), round(rect.y1, 1))
+        key = rect_key(rect)
         if key in seen:
             continue
         seen.add(key)
@@ -475,29 +633,6 @@ def collect_visual_rects(
     return rects
 
 
-def has_visual_signal(
-    page,
-    min_image_area_ratio: float,
-    min_drawing_area_ratio: float,
-    min_drawings_count: int,
-) -> bool:
-    if fitz is None:
-        return False
-
-    if collect_visual_rects(
-        page=page,
-        min_image_area_ratio=min_image_area_ratio,
-        min_drawing_area_ratio=min_drawing_area_ratio,
-    ):
-        return True
-
-    try:
-        drawings = page.get_drawings() or []
-    except Exception:
-        drawings = []
-    return len(drawings) >= int(min_drawings_count)
-
-
 def build_caption_aware_clip(
     page,
     caption_top_margin_pt: float,
@@ -529,20 +664,20 @@ def build_caption_aware_clip(
     if not visual_rects:
         return None, caption_count
 
+    # (y0, y1, area) per visual rect, converted once instead of per caption.
+    visual_spans = [(float(vr.y0), float(vr.y1), rect_area(vr)) for vr in visual_rects]
+
     if caption_rects:
         max_gap = float(page_rect.height) * 0.25
         filtered_caps: List["fitz.Rect"] = []
         for cap in caption_rects:
-            best_gap: Optional[float] = None
-            for vr in visual_rects:
-                gap = 0.0
-                if float(vr.y1) <= float(cap.y0):
-                    gap = float(cap.y0) - float(vr.y1)
-                elif float(vr.y0) >= float(cap.y1):
-                    gap = float(vr.y0) - float(cap.y1)
-                if best_gap is None or gap < best_gap:
-                    best_gap = gap
-            if best_gap is not None and best_gap <= max_gap:
+            cap_y0 = float(cap.y0)
+            cap_y1 = float(cap.y1)
+            best_gap = min(
+                cap_y0 - vy1 if vy1 <= cap_y0 else (vy0 - cap_y1 if vy0 >= cap_y1 else 0.0)
+                for vy0, vy1, _ in visual_spans
+            )
+            if best_gap <= max_gap:
                 filtered_caps.append(cap)
         caption_rects = filtered_caps
 
@@ -550,10 +685,14 @@ def build_caption_aware_clip(
     if caption_rects:
         tol = max(6.0, float(page_rect.height) * 0.01)
         for cap in caption_rects:
-            above = [vr for vr in visual_rects if float(vr.y1) <= float(cap.y0) + tol]
-            below = [vr for vr in visual_rects if float(vr.y0) >= float(cap.y1) - tol]
-            above_area = sum(rect_area(vr) for vr in above)
-            below_area = sum(rect_area(vr) for vr in below)
+            upper = float(cap.y0) + tol
+            lower = float(cap.y1) - tol
+            above_idx = [i for i, (_, vy1, _) in enumerate(visual_spans) if vy1 <= upper]
+            below_idx = [i for i, (vy0, _, _) in enumerate(visual_spans) if vy0 >= lower]
+            above = [visual_rects[i] for i in above_idx]
+            below = [visual_rects[i] for i in below_idx]
+            above_area = sum(visual_spans[i][2] for i in above_idx)
+            below_area = sum(visual_spans[i][2] for i in below_idx)
             if above_area <= 0 and below_area <= 0:
                 continue
             candidates = above if above_area >= below_area else below
@@ -586,7 +725,74 @@ def build_caption_aware_clip(
     return clip, caption_count
 
 
-def render_figure_pages(
+def render_page(
+    doc,
+    page_no: int,
+    render_index: int,
+    image_dir: Path,
+    prefix: str,
+    dpi: int,
+    crop_mode: str,
+    caption_top_margin_pt: float,
+    crop_bottom_margin_pt: float,
+    min_crop_height_ratio: float,
+    caption_queries: List[str],
+) -> Dict[str, object]:
+    page = doc[page_no - 1]
+    scale = max(1.0, float(dpi) / 72.0)
+    matrix = fitz.Matrix(scale, scale)
+    clip_rect = None
+    caption_rect_count = 0
+    if crop_mode == "caption-aware":
+        clip_rect, caption_rect_count = build_caption_aware_clip(
+            page=page,
+            caption_top_margin_pt=caption_top_margin_pt,
+            crop_bottom_margin_pt=crop_bottom_margin_pt,
+            min_crop_height_ratio=min_crop_height_ratio,
+            caption_queries=caption_queries,
+        )
+
+    pix = page.get_pixmap(matrix=matrix, alpha=False, clip=clip_rect)
+    filename = f"{prefix}_p{page_no:03d}_render_{dpi}dpi"
+    if clip_rect is not None:
+        filename += "_capcrop"
+    filename += ".png"
+    out_path = image_dir / filename
+    pix.save(str(out_path))
+    return {
+        "source": "page_render",
+        "page": page_no,
+        "render_index": render_index,
+        "dpi": dpi,
+        "width": pix.width,
+        "height": pix.height,
+        "size_bytes": out_path.stat().st_size,
+        "crop_mode": crop_mode,
+        "crop_applied": clip_rect is not None,
+        "caption_rect_count": caption_rect_count,
+        "clip_rect": [clip_rect.x0, clip_rect.y0, clip_rect.x1, clip_rect.y1] if clip_rect is not None else None,
+        "path": str(out_path),
+    }
+
+
+def render_page_batch(
+    pdf_path: Path,
+    jobs: List[Tuple[int, int, List[str]]],
+    options: Dict[str, object],
+) -> List[Dict[str, object]]:
+    # Runs in a worker process; fitz documents can't be shared, so each worker opens its own.
+    doc = fitz.open(str(pdf_path))
+    try:
+        return [
+            render_page(doc, page_no=page_no, render_index=idx, caption_queries=queries, **options)
+            for idx, page_no, queries in jobs
+        ]
+    finally:
+        doc.close()
+
+
+def start_figure_renders(
+    doc,
     pdf_path: Path,
     image_dir: Path,
     prefix: str,
@@ -597,58 +803,68 @@ def render_figure_pages(
     crop_bottom_margin_pt: float,
     min_crop_height_ratio: float,
     caption_queries_by_page: Dict[int, List[str]],
-) -> List[Dict[str, object]]:
-    if fitz is None:
-        return []
+) -> Dict[str, object]:
+    # Submits the renders and returns at once; finish_figure_renders() collects them into the manifest.
+    handle: Dict[str, object] = {"jobs": [], "options": {}, "pool": None, "futures": []}
+    if doc is None:
+        return handle
 
     image_dir.mkdir(parents=True, exist_ok=True)
-    manifest: List[Dict[str, object]] = []
-    doc = fitz.open(str(pdf_path))
-    scale = max(1.0, float(dpi) / 72.0)
-    matrix = fitz.Matrix(scale, scale)
+    jobs = [
+        (idx, page_no, caption_queries_by_page.get(page_no, []))
+        for idx, page_no in enumerate(pages_to_render, start=1)
+        if 1 <= page_no <= len(doc)
+    ]
+    options: Dict[str, object] = {
+        "image_dir": image_dir,
+        "prefix": prefix,
+        "dpi": dpi,
+        "crop_mode": crop_mode,
+        "caption_top_margin_pt": caption_top_margin_pt,
+        "crop_bottom_margin_pt": crop_bottom_margin_pt,
+        "min_crop_height_ratio": min_crop_height_ratio,
+    }
+    handle["jobs"] = jobs
+    handle["options"] = options
+
+    # Rasterizing and PNG-encoding is CPU-bound and PyMuPDF holds the GIL, so pages are split across processes.
+    workers = min(MAX_RENDER_WORKERS, os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        return handle
+
+    pool = None
     try:
-        for idx, page_no in enumerate(pages_to_render, start=1):
-            if page_no < 1 or page_no > len(doc):
-                continue
-            page = doc[page_no - 1]
-            clip_rect = None
-            caption_rect_count = 0
-            if crop_mode == "caption-aware":
-                caption_queries = caption_queries_by_page.get(page_no, [])
-                clip_rect, caption_rect_count = build_caption_aware_clip(
-                    page=page,
-                    caption_top_margin_pt=caption_top_margin_pt,
-                    crop_bottom_margin_pt=crop_bottom_margin_pt,
-                    min_crop_height_ratio=min_crop_height_ratio,
-                    caption_queries=caption_queries,
-                )
+        # spawn: workers open the PDF themselves instead of forking this process's open MuPDF document.
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        futures = [pool.submit(render_page_batch, pdf_path, jobs[i::workers], options) for i in range(workers)]
+    except (OSError, BrokenProcessPool):
+        # No usable worker processes here; finish_figure_renders() renders the pages in this process.
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        return handle
+    handle["pool"] = pool
+    handle["futures"] = futures
+    return handle
+
+
+def finish_figure_renders(doc, handle: Dict[str, object]) -> List[Dict[str, object]]:
+    jobs = handle["jobs"]
+    options = handle["options"]
+    pool = handle["pool"]
+    if pool is not None:
+        try:
+            by_index = {entry["render_index"]: entry for future in handle["futures"] for entry in future.result()}
+            return [by_index[idx] for idx, _, _ in jobs]
+        except (OSError, BrokenProcessPool):
+            # A worker died or could not start; re-render every page here (same file names, so nothing is left stale).
+            pass
+        finally:
+            pool.shutdown()
 
-            pix = page.get_pixmap(matrix=matrix, alpha=False, clip=clip_rect)
-            filename = f"{prefix}_p{page_no:03d}_render_{dpi}dpi"
-            if clip_rect is not None:
-                filename += "_capcrop"
-            filename += ".png"
-            out_path = image_dir / filename
-            pix.save(str(out_path))
-            manifest.append(
-                {
-                    "source": "page_render",
-                    "page": page_no,
-                    "render_index": idx,
-                    "dpi": dpi,
-                    "width": pix.width,
-                    "height": pix.height,
-                    "size_bytes": out_path.stat().st_size,
-                    "crop_mode": crop_mode,
-                    "crop_applied": clip_rect is not None,
-                    "caption_rect_count": caption_rect_count,
-                    "clip_rect": [clip_rect.x0, clip_rect.y0, clip_rect.x1, clip_rect.y1] if clip_rect is not None else None,
-                    "path": str(out_path),
-                }
-            )
-    finally:
-        doc.close()
-    return manifest
+    return [
+        render_page(doc, page_no=page_no, render_index=idx, caption_queries=queries, **options)
+        for idx, page_no, queries in jobs
+    ]
 
 
 def main() -> int:
@@ -742,11 +958,23 @@ def main() -> int:
     parser.add_argument("--embedded-min-width", type=int, default=400, help="Min width for embedded images.")
     parser.add_argument("--embedded-min-height", type=int, default=300, help="Min height for embedded images.")
     parser.add_argument("--embedded-min-area", type=int, default=120000, help="Min area (w*h) for embedded images.")
+    parser.add_argument(
+        "--embedded-max-dim",
+        type=int,
+        default=0,
+        help="Opt-in: halve embedded images until the longer side is below 2x this value (default 0 keeps full resolution).",
+    )
     parser.add_argument(
         "--keep-embedded-on-rendered-pages",
         action="store_true",
         help="In hybrid mode, keep embedded images even when the same page is rendered.",
     )
+    parser.add_argument(
+        "--tables-cache",
+        metavar="DIR",
+        default=None,
+        help="Opt-in directory for caching extracted tables by PDF content across runs (default: no cache).",
+    )
     args = parser.parse_args()
     try:
         summary_mode = normalize_summary_mode(args.summary_mode)
@@ -763,185 +991,227 @@ def main() -> int:
         return 1
 
     reader = PdfReader(str(pdf_path))
-    paper_title = extract_paper_title(pdf_path=pdf_path, reader=reader)
-    extracted_name = safe_paper_name(paper_title)
-    bundle_name = safe_paper_name(str(args.bundle_name)) if args.bundle_name else extracted_name
-    prefix = normalize_name(args.prefix if args.prefix else bundle_name)
-    summary_filename = f"{extracted_name}阅读总结.md"
-
-    if args.layout == "bundle":
-        run_out_dir = base_out_dir / bundle_name
-        if args.clean and run_out_dir.exists():
-            shutil.rmtree(run_out_dir)
-        run_out_dir.mkdir(parents=True, exist_ok=True)
-        image_dir = run_out_dir / "images"
-        summary_path = run_out_dir / summary_filename
-
-        def path_for(name: str) -> Path:
-            return run_out_dir / name
-
-    else:
-        run_out_dir = base_out_dir
-        if args.clean:
-            for old_file in base_out_dir.glob(f"{prefix}_*"):
-                if old_file.is_dir():
-                    shutil.rmtree(old_file, ignore_errors=True)
-                else:
-                    old_file.unlink(missing_ok=True)
-        image_dir = base_out_dir / f"{prefix}_images"
-        summary_path = base_out_dir / summary_filename
-
-        def path_for(name: str) -> Path:
-            return base_out_dir / f"{prefix}_{name}"
-
-    page_text_parts: List[str] = []
-    page_lines: List[Tuple[int, List[str]]] = []
-
-    figure_captions: List[Dict[str, object]] = []
-    table_captions: List[Dict[str, object]] = []
-    code_signals: List[Dict[str, object]] = []
-
-    all_urls: Set[str] = set()
-    url_hits: List[Dict[str, object]] = []
-
-    for page_idx, page in enumerate(reader.pages, start=1):
-        text = page.extract_text() or ""
-        lines = text.splitlines()
-        page_lines.append((page_idx, lines))
-        page_text_parts.append(f"\n\n===== Page {page_idx} =====\n{text}")
-
-        for raw_line in lines:
-            line = raw_line.strip()
-            if not line:
+    # One PyMuPDF document serves text, link, render and embedded-image extraction.
+    doc = fitz.open(str(pdf_path)) if fitz is not None else None
+    try:
+        paper_title = extract_paper_title(pdf_path=pdf_path, reader=reader)
+        extracted_name = safe_paper_name(paper_title)
+        bundle_name = safe_paper_name(str(args.bundle_name)) if args.bundle_name else extracted_name
+        prefix = normalize_name(args.prefix if args.prefix else bundle_name)
+        summary_filename = f"{extracted_name}阅读总结.md"
+
+        if args.layout == "bundle":
+            run_out_dir = base_out_dir / bundle_name
+            if args.clean and run_out_dir.exists():
+                shutil.rmtree(run_out_dir)
+            run_out_dir.mkdir(parents=True, exist_ok=True)
+            image_dir = run_out_dir / "images"
+            summary_path = run_out_dir / summary_filename
+
+            def path_for(name: str) -> Path:
+                return run_out_dir / name
+
+        else:
+            run_out_dir = base_out_dir
+            if args.clean:
+                for old_file in base_out_dir.glob(f"{prefix}_*"):
+                    if old_file.is_dir():
+                        shutil.rmtree(old_file, ignore_errors=True)
+                    else:
+                        old_file.unlink(missing_ok=True)
+            image_dir = base_out_dir / f"{prefix}_images"
+            summary_path = base_out_dir / summary_filename
+
+            def path_for(name: str) -> Path:
+                return base_out_dir / f"{prefix}_{name}"
+
+        figure_captions: List[Dict[str, object]] = []
+        table_captions: List[Dict[str, object]] = []
+        code_signals: List[Dict[str, object]] = []
+
+        all_urls: Set[str] = set()
+        url_hits: List[Dict[str, object]] = []
+        section_snippets: List[Dict[str, object]] = []
+        # Headers/footers repeat the same URLs on every page; validate each distinct URL once.
+        url_usable: Dict[str, bool] = {}
+
+        # Page text goes straight to fulltext.txt instead of being held in memory until the end.
+        with path_for("fulltext.txt").open("w", encoding="utf-8") as fulltext_file:
+            for page_idx, text, link_urls in iter_page_texts(reader, doc):
+                lines = text.splitlines()
+                fulltext_file.write(f"\n\n===== Page {page_idx} =====\n{text}")
+                section_snippets.extend(collect_section_snippets(page_idx, lines))
+
+                for raw_line in lines:
+                    line = raw_line.strip()
+                    if not line:
+                        continue
+                    # Figure captions start with "F" and table captions with "T"; at most one can match.
+                    first = line[0]
+                    if first == "F":
+                        if FIGURE_CAPTION_RE.match(line):
+                            figure_captions.append({"page": page_idx, "line": line})
+                    elif first == "T":
+                        if TABLE_CAPTION_RE.match(line):
+                            table_captions.append({"page": page_idx, "line": line})
+                    if has_code_signal(line):
+                        code_signals.append({"page": page_idx, "line": line})
+
+                    if "http" not in line:
+                        continue
+                    for match in URL_RE.findall(line):
+                        clean = clean_url(match)
+                        if not clean:
+                            continue
+                        usable = url_usable.get(clean)
+                        if usable is None:
+                            usable = url_usable[clean] = is_usable_url(clean)
+                        if usable:
+                            all_urls.add(clean)
+                            url_hits.append({"page": page_idx, "url": clean, "context": line})
+
+                for uri in link_urls:
+                    clean = clean_url(uri)
+                    if not clean:
+                        continue
+                    usable = url_usable.get(clean)
+                    if usable is None:
+                        usable = url_usable[clean] = is_usable_url(clean)
+                    if usable:
+                        all_urls.add(clean)
+                        url_hits.append({"page": page_idx, "url": clean, "context": "[annotation]"})
+
+        metadata = {
+            "pdf_path": str(pdf_path),
+            "paper_title": paper_title,
+            "paper_name": bundle_name,
+            "paper_name_extracted": extracted_name,
+            "bundle_name": bundle_name,
+            "num_pages": len(reader.pages),
+            "prefix": prefix,
+            "layout": args.layout,
+            "output_dir": str(run_out_dir),
+            "summary_file": str(summary_path),
+            "summary_mode": summary_mode,
+            "summary_init": args.summary_init,
+            "image_settings": {
+                "image_mode": args.image_mode,
+                "figure_pages": args.figure_pages,
+                "render_dpi": args.render_dpi,
+                "render_crop_mode": args.render_crop_mode,
+                "caption_top_margin_pt": args.caption_top_margin_pt,
+                "crop_bottom_margin_pt": args.crop_bottom_margin_pt,
+                "min_crop_height_ratio": args.min_crop_height_ratio,
+                "max_captions_per_render_page": args.max_captions_per_render_page,
+                "embedded_min_width": args.embedded_min_width,
+                "embedded_min_height": args.embedded_min_height,
+                "embedded_min_area": args.embedded_min_area,
+                "embedded_max_dim": args.embedded_max_dim,
+                "keep_embedded_on_rendered_pages": args.keep_embedded_on_rendered_pages,
+            },
+            "pdf_metadata": {k: str(v) for k, v in (reader.metadata or {}).items()},
+            "optional_modules": {
+                "pdfplumber": HAS_PDFPLUMBER,
+                "pymupdf": fitz is not None,
+            },
+        }
+
+        # One pass fills both link maps; each distinct (url, context) pair is categorized once.
+        availability_pages = {int(item["page"]) for item in section_snippets}
+        categorized: Dict[str, Set[str]] = {"code": set(), "data": set(), "supplementary": set(), "doi": set(), "other": set()}
+        priority_categorized: Dict[str, Set[str]] = {"code": set(), "data": set(), "supplementary": set(), "doi": set(), "other": set()}
+        category_cache: Dict[Tuple[str, str], str] = {}
+        availability_search = AVAILABILITY_SIGNAL_RE.search
+        # url_hits is built above with int pages and str url/context, so no coercion is needed here.
+        for hit in url_hits:
+            page = hit["page"]
+            url = hit["url"]
+            context = hit["context"]
+            key = (url, context)
+            category = category_cache.get(key)
+            if category is None:
+                category = category_cache[key] = categorize_url(url, context)
+            categorized[category].add(url)
+            if page in availability_pages or availability_search(context):
+                priority_categorized[category].add(url)
+
+        resource_links = {key: collapse_parent_urls(value) for key, value in categorized.items()}
+        resource_links_priority = {key: collapse_parent_urls(value) for key, value in priority_categorized.items()}
+
+        tables_cache_path: Optional[Path] = None
+        tables: Optional[List[Dict[str, object]]] = None
+        if args.tables_cache:
+            cache_key = tables_cache_key(pdf_path, doc)
+            if cache_key is not None:
+                tables_cache_path = Path(args.tables_cache).expanduser().resolve() / f"{cache_key}.json"
+                tables = load_tables_cache(tables_cache_path)
+        if tables is None:
+            tables = extract_tables(pdf_path, doc)
+            if tables_cache_path is not None:
+                store_tables_cache(tables_cache_path, tables)
+        # Per-page sets keep the ordered query lists free of duplicates without scanning them.
+        caption_queries_by_page: Dict[int, List[str]] = defaultdict(list)
+        seen_queries_by_page: Dict[int, Set[str]] = defaultdict(set)
+        for item in (figure_captions + table_captions):
+            page = int(item.get("page", 0))
+            line = str(item.get("line", ""))
+            if page <= 0 or not line:
                 continue
-            if FIGURE_CAPTION_RE.match(line):
-                figure_captions.append({"page": page_idx, "line": line})
-            if TABLE_CAPTION_RE.match(line):
-                table_captions.append({"page": page_idx, "line": line})
-            if CODE_SIGNAL_RE.search(line):
-                code_signals.append({"page": page_idx, "line": line})
-
-            for match in URL_RE.findall(line):
-                clean = clean_url(match)
-                if clean and is_usable_url(clean):
-                    all_urls.add(clean)
-                    url_hits.append({"page": page_idx, "url": clean, "context": line})
-
-        for uri in extract_annotation_urls(page):
-            clean = clean_url(uri)
-            if clean and is_usable_url(clean):
-                all_urls.add(clean)
-                url_hits.append({"page": page_idx, "url": clean, "context": "[annotation]"})
-
-    metadata = {
-        "pdf_path": str(pdf_path),
-        "paper_title": paper_title,
-        "paper_name": bundle_name,
-        "paper_name_extracted": extracted_name,
-        "bundle_name": bundle_name,
-        "num_pages": len(reader.pages),
-        "prefix": prefix,
-        "layout": args.layout,
-        "output_dir": str(run_out_dir),
-        "summary_file": str(summary_path),
-        "summary_mode": summary_mode,
-        "summary_init": args.summary_init,
-        "image_settings": {
-            "image_mode": args.image_mode,
-            "figure_pages": args.figure_pages,
-            "render_dpi": args.render_dpi,
-            "render_crop_mode": args.render_crop_mode,
-            "caption_top_margin_pt": args.caption_top_margin_pt,
-            "crop_bottom_margin_pt": args.crop_bottom_margin_pt,
-            "min_crop_height_ratio": args.min_crop_height_ratio,
-            "max_captions_per_render_page": args.max_captions_per_render_page,
-            "embedded_min_width": args.embedded_min_width,
-            "embedded_min_height": args.embedded_min_height,
-            "embedded_min_area": args.embedded_min_area,
-            "keep_embedded_on_rendered_pages": args.keep_embedded_on_rendered_pages,
-        },
-        "pdf_metadata": {k: str(v) for k, v in (reader.metadata or {}).items()},
-        "optional_modules": {
-            "pdfplumber": pdfplumber is not None,
-            "pymupdf": fitz is not None,
-        },
-    }
-
-    section_snippets = collect_section_snippets(page_lines)
-
-    categorized: Dict[str, Set[str]] = {"code": set(), "data": set(), "supplementary": set(), "doi": set(), "other": set()}
-    for hit in url_hits:
-        url = str(hit["url"])
-        context = str(hit["context"])
-        category = categorize_url(url, context)
-        categorized[category].add(url)
-
-    resource_links = {key: collapse_parent_urls(value) for key, value in categorized.items()}
-
-    availability_pages = {int(item["page"]) for item in section_snippets}
-    priority_categorized: Dict[str, Set[str]] = {"code": set(), "data": set(), "supplementary": set(), "doi": set(), "other": set()}
-    for hit in url_hits:
-        page = int(hit["page"])
-        context = str(hit["context"])
-        if page not in availability_pages and not AVAILABILITY_SIGNAL_RE.search(context):
-            continue
-        url = str(hit["url"])
-        category = categorize_url(url, context)
-        priority_categorized[category].add(url)
-
-    resource_links_priority = {key: collapse_parent_urls(value) for key, value in priority_categorized.items()}
+            query = caption_query_from_line(line)
+            if not query:
+                continue
+            seen_queries = seen_queries_by_page[page]
+            if query not in seen_queries:
+                seen_queries.add(query)
+                caption_queries_by_page[page].append(query)
+
+        images_manifest: List[Dict[str, object]] = []
+        pages_to_render: List[int] = []
+        render_handle: Optional[Dict[str, object]] = None
+        if args.image_mode in {"render", "hybrid"}:
+            pages_to_render = select_render_pages(
+                num_pages=len(reader.pages),
+                captions=(figure_captions + table_captions),
+                mode=args.figure_pages,
+                max_captions_per_page=args.max_captions_per_render_page,
+            )
+            render_handle = start_figure_renders(
+                doc=doc,
+                pdf_path=pdf_path,
+                image_dir=image_dir,
+                prefix=prefix,
+                pages_to_render=pages_to_render,
+                dpi=args.render_dpi,
+                crop_mode=args.render_crop_mode,
+                caption_top_margin_pt=args.caption_top_margin_pt,
+                crop_bottom_margin_pt=args.crop_bottom_margin_pt,
+                min_crop_height_ratio=args.min_crop_height_ratio,
+                caption_queries_by_page=caption_queries_by_page,
+            )
 
-    tables = extract_tables(pdf_path)
-    caption_queries_by_page: Dict[int, List[str]] = {}
-    for item in (figure_captions + table_captions):
-        page = int(item.get("page", 0))
-        line = str(item.get("line", ""))
-        if page <= 0 or not line:
-            continue
-        query = caption_query_from_line(line)
-        if not query:
-            continue
-        existing = caption_queries_by_page.setdefault(page, [])
-        if query not in existing:
-            existing.append(query)
-
-    images_manifest: List[Dict[str, object]] = []
-    pages_to_render: List[int] = []
-    render_manifest: List[Dict[str, object]] = []
-    if args.image_mode in {"render", "hybrid"}:
-        pages_to_render = select_render_pages(
-            num_pages=len(reader.pages),
-            captions=(figure_captions + table_captions),
-            mode=args.figure_pages,
-            max_captions_per_page=args.max_captions_per_render_page,
-        )
-        render_manifest = render_figure_pages(
-            pdf_path=pdf_path,
-            image_dir=image_dir,
-            prefix=prefix,
-            pages_to_render=pages_to_render,
-            dpi=args.render_dpi,
-            crop_mode=args.render_crop_mode,
-            caption_top_margin_pt=args.caption_top_margin_pt,
-            crop_bottom_margin_pt=args.crop_bottom_margin_pt,
-            min_crop_height_ratio=args.min_crop_height_ratio,
-            caption_queries_by_page=caption_queries_by_page,
-        )
+        # Runs in this process while any worker processes render pages.
+        embedded_manifest: List[Dict[str, object]] = []
+        if args.image_mode in {"embedded", "hybrid"}:
+            embedded_skip_pages: Set[int] = set()
+            if args.image_mode == "hybrid" and pages_to_render and not args.keep_embedded_on_rendered_pages:
+                embedded_skip_pages = set(pages_to_render)
+            embedded_manifest = extract_embedded_images(
+                doc=doc,
+                image_dir=image_dir,
+                prefix=prefix,
+                min_width=args.embedded_min_width,
+                min_height=args.embedded_min_height,
+                min_area=args.embedded_min_area,
+                max_dim=args.embedded_max_dim,
+                skip_pages=embedded_skip_pages,
+            )
 
-    embedded_manifest: List[Dict[str, object]] = []
-    if args.image_mode in {"embedded", "hybrid"}:
-        embedded_skip_pages: Set[int] = set()
-        if args.image_mode == "hybrid" and pages_to_render and not args.keep_embedded_on_rendered_pages:
-            embedded_skip_pages = set(pages_to_render)
-        embedded_manifest = extract_embedded_images(
-            pdf_path=pdf_path,
-            image_dir=image_dir,
-            prefix=prefix,
-            min_width=args.embedded_min_width,
-            min_height=args.embedded_min_height,
-            min_area=args.embedded_min_area,
-            skip_pages=embedded_skip_pages,
-        )
+        render_manifest: List[Dict[str, object]] = []
+        if render_handle is not None:
+            render_manifest = finish_figure_renders(doc, render_handle)
+    finally:
+        if doc is not None:
+            doc.close()
 
     images_manifest.extend(embedded_manifest)
     images_manifest.extend(render_manifest)
@@ -949,12 +1219,8 @@ def main() -> int:
     metadata["image_settings"]["render_pages_selected"] = pages_to_render
     metadata["image_settings"]["caption_queries_by_page"] = caption_queries_by_page
 
-    image_source_counts: Dict[str, int] = {}
-    for item in images_manifest:
-        src = str(item.get("source", "unknown"))
-        image_source_counts[src] = image_source_counts.get(src, 0) + 1
+    image_source_counts: Dict[str, int] = Counter(str(item.get("source", "unknown")) for item in images_manifest)
 
-    write_text(path_for("fulltext.txt"), "".join(page_text_parts))
     write_json(path_for("metadata.json"), metadata)
     write_text(path_for("urls_all.txt"), "\n".join(sorted(all_urls)))
     write_json(path_for("url_hits.json"), url_hits)
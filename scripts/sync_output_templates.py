@@ -19,6 +19,7 @@ TEMPLATE_PAIRS = (
 )
 
 COMMENT_RE = re.compile(r"<!--.*?-->", flags=re.S)
+TRAILING_COLON_RE = re.compile(r"([：:])\s*$")
 
 
 def _extract_report_structure(prompt_text: str, source_path: Path) -> str:
@@ -44,7 +45,8 @@ def _normalize_output(text: str) -> str:
     raw_lines = []
     for line in text.splitlines():
         line = line.rstrip()
-        line = re.sub(r"([：:])\s*$", r"\1<复制原文>", line) if "证据原文摘录" in line and "<复制原文>" not in line else line
+        if "证据原文摘录" in line and "<复制原文>" not in line:
+            line = TRAILING_COLON_RE.sub(r"\1<复制原文>", line)
         raw_lines.append(line)
 
     while raw_lines and not raw_lines[0].strip():
@@ -15,10 +15,13 @@ from pathlib import Path
 
 def load_summary_path(artifact_dir: Path) -> Path:
     metadata_path = artifact_dir / "metadata.json"
-    if not metadata_path.exists():
+    # Open directly instead of probing with exists() first: one syscall round-trip, no race.
+    try:
+        metadata_text = metadata_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
         raise SystemExit(f"[ERROR] metadata.json not found: {metadata_path}")
 
-    metadata = json.loads(metadata_path.read_text(encoding="utf-8"))
+    metadata = json.loads(metadata_text)
     summary_raw = str(metadata.get("summary_file", "")).strip()
     if summary_raw:
         return Path(summary_raw).expanduser().resolve()
@@ -38,16 +41,17 @@ def main() -> int:
         raise SystemExit("[ERROR] specify exactly one of --input-file or --from-stdin")
 
     artifact_dir = Path(args.artifact_dir).expanduser().resolve()
-    if not artifact_dir.exists() or not artifact_dir.is_dir():
+    if not artifact_dir.is_dir():
         raise SystemExit(f"[ERROR] artifact_dir not found: {artifact_dir}")
 
     if args.from_stdin:
         content = sys.stdin.read()
     else:
         input_path = Path(str(args.input_file)).expanduser().resolve()
-        if not input_path.exists():
+        try:
+            content = input_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
             raise SystemExit(f"[ERROR] input file not found: {input_path}")
-        content = input_path.read_text(encoding="utf-8")
 
     if not content.strip():
         raise SystemExit("[ERROR] report content is empty.")